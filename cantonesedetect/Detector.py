@@ -4,15 +4,72 @@ Core logic:
 2. If split_seg is true, judge the input by aggregating the judgements of the segments. Otherwise judge the input as a whole segment.
 3. If print_stat is true, print the Cantonese and SWC ratio to I/O. 
 """
+import functools
+import hashlib
+import itertools
 import math
 import re
-from collections import Counter
+from dataclasses import dataclass
 from typing import Tuple
 
 from cantonesedetect.SegmentFeatures import SegmentFeatures
 
+try:
+    # Optional: the google-re2 bindings compile large literal alternations to a
+    # linear-time DFA, which is much faster than re's backtracking on the
+    # feature patterns. Everything falls back to re when it is not installed.
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # Optional: Hyperscan scans all four feature patterns simultaneously in one
+    # vectorized pass, which is the fastest backend for long documents.
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # Optional: pyahocorasick matches the whole literal vocabulary of the
+    # feature patterns in one C-implemented automaton pass.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: NumPy vectorizes the Han-character count over a codepoint array.
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional: Numba JIT-compiles the combined counting kernel. It cannot call
+    # Python's re, so the kernel works on literal tables instead (see below).
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _compile(pattern: str):
+    """
+    Compile a feature pattern with RE2 when available, falling back to re.
+
+    Args:
+        pattern (str): The pattern source to compile.
+
+    Returns:
+        The compiled pattern object.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            # RE2 rejects some constructs (e.g. backreferences); use re instead.
+            pass
+    return re.compile(pattern)
+
 # Cantonese characters not found in SWC
-CANTO_FEATURE_RE = re.compile(
+CANTO_FEATURE = (
     r'[嘅嗰啲咗佢喺咁噉冇啩哋畀嚟諗惗乜嘢閪撚𨳍𨳊瞓睇㗎餸𨋢摷喎嚿噃嚡嘥嗮啱揾搵喐逳噏𢳂岋糴揈捹撳㩒𥄫攰癐冚孻冧𡃁嚫跣𨃩瀡氹嬲掟孭黐唞㪗埞忟𢛴嗱係唔喇俾]|'
     r'唔[係得會好識使洗駛通知到去走掂該錯差]|點[樣會做得解]|[琴尋噚聽第]日|[而依]家|家[下陣]|[真就實梗又話都]係|邊[度個位科]|'
     r'[嚇凍攝整揩逢淥浸激][親嚫]|[橫搞傾諗得唔]掂|仲[有係話要得好衰唔]|返[學工去歸]|執[好生實返輸]|[留坐剩]低|'
@@ -20,13 +77,13 @@ CANTO_FEATURE_RE = re.compile(
 )
 
 # A list of exceptions where the above characters can be found in SWC
-CANTO_EXCLUDE_RE = re.compile(r'(關係|吱唔|咿唔|喇嘛|喇叭|俾路支|俾斯麥)')
+CANTO_EXCLUDE = r'(?:關係|吱唔|咿唔|喇嘛|喇叭|俾路支|俾斯麥)'
 
 # SWC characters that are less common in Cantonese
-SWC_FEATURE_RE = re.compile(r'[這哪唄咱啥甭那是的他她它吧沒麼么些了卻説說吃弄把也在]|而已')
+SWC_FEATURE = r'[這哪唄咱啥甭那是的他她它吧沒麼么些了卻説說吃弄把也在]|而已'
 
 # A list of exceptions where the above characters can be found in Cantonese (mainly phrases or proper nouns)
-SWC_EXCLUDE_RE = re.compile(
+SWC_EXCLUDE = (
     r'亞利桑那|剎那|巴塞羅那|薩那|沙那|哈瓦那|印第安那|那不勒斯|支那|'
     r'是[否日次非但旦]|[利於]是|唯命是從|頭頭是道|似是而非|自以為是|俯拾皆是|撩是鬥非|莫衷一是|唯才是用|'
     r'[目綠藍紅中]的|的[士確式]|波羅的海|眾矢之的|的而且確|大眼的度|的起心肝'
@@ -45,6 +102,70 @@ SWC_EXCLUDE_RE = re.compile(
     r'在[場乎下校學行任野意於望內案旁生世心線逃位即職座囚此家]|[站志旨爭所勝衰實內外念現好健存潛差弊活]在|我思故我在'
 )
 
+# The individual patterns, kept for inspection and debugging.
+CANTO_FEATURE_RE = _compile(CANTO_FEATURE)
+CANTO_EXCLUDE_RE = _compile(CANTO_EXCLUDE)
+SWC_FEATURE_RE = _compile(SWC_FEATURE)
+SWC_EXCLUDE_RE = _compile(SWC_EXCLUDE)
+
+# Each category's exclusions fused with its features, so one scan per category
+# replaces two. The exclusion branch comes first: an excluded phrase consumes
+# its span before the same category's features can match inside it, which is
+# what the findall-then-subtract passes achieved. The categories are scanned
+# independently of each other, so an SWC exclusion can never hide a Cantonese
+# feature or vice versa (是但 and 冧把 count as Cantonese features even though
+# both are SWC exclusions).
+_CANTO_FUSED_RE = _compile(
+    f'(?P<canto_exclude>{CANTO_EXCLUDE})|(?P<canto_feature>{CANTO_FEATURE})')
+_SWC_FUSED_RE = _compile(
+    f'(?P<swc_exclude>{SWC_EXCLUDE})|(?P<swc_feature>{SWC_FEATURE})')
+
+# Prebound methods: save a global and an attribute lookup on every call in the
+# hot counting path.
+_canto_finditer = _CANTO_FUSED_RE.finditer
+_swc_finditer = _SWC_FUSED_RE.finditer
+
+# Byte-level twins of the fused patterns. RE2 scans UTF-8 natively, so handing
+# it pre-encoded bytes skips the str-to-UTF-8 conversion inside the bindings on
+# every call. Python's re gains nothing from byte input on CJK text (three
+# bytes per character instead of one code unit), so the twins are RE2-only.
+_CANTO_FUSED_RE_B = _SWC_FUSED_RE_B = None
+if re2 is not None:
+    try:
+        _CANTO_FUSED_RE_B = re2.compile(
+            _CANTO_FUSED_RE.pattern.encode('utf-8'))
+        _SWC_FUSED_RE_B = re2.compile(
+            _SWC_FUSED_RE.pattern.encode('utf-8'))
+    except Exception:
+        _CANTO_FUSED_RE_B = _SWC_FUSED_RE_B = None
+_canto_b_finditer = (_CANTO_FUSED_RE_B.finditer
+                     if _CANTO_FUSED_RE_B is not None else None)
+_swc_b_finditer = (_SWC_FUSED_RE_B.finditer
+                   if _SWC_FUSED_RE_B is not None else None)
+
+
+def _pattern_source_hash() -> str:
+    """
+    Hash of the four pattern sources, for validating generated artifacts.
+
+    Returns:
+        str: The hex digest identifying the current pattern vocabulary.
+    """
+    joined = '\n'.join((CANTO_EXCLUDE, SWC_EXCLUDE, CANTO_FEATURE, SWC_FEATURE))
+    return hashlib.sha1(joined.encode('utf-8')).hexdigest()
+
+
+try:
+    # Generated by tools/build_matcher.py: a first-character dispatch matcher
+    # specialized to the pattern vocabulary above.
+    from cantonesedetect import _matcher_gen
+except ImportError:
+    _matcher_gen = None
+
+if _matcher_gen is not None and _matcher_gen.SOURCE_HASH != _pattern_source_hash():
+    # The patterns changed without rerunning the generator; ignore the module.
+    _matcher_gen = None
+
 # A list of quotes: Content inside and outside a pair of quotes should be treated separately.
 ALL_QUOTEMARKS_RE = re.compile(
     r'「([^「]*)」|“([^“]*)”|《([^《]*)》|【([^【]*)】|『([^『]*)』')
@@ -57,6 +178,453 @@ ALL_HAN_RE = re.compile(
     r'\U00030000-\U000323af\ufa0e\ufa0f\ufa11\ufa13\ufa14\ufa1f\ufa21\ufa23\ufa24\ufa27\ufa28\ufa29\u3006\u3007]'
     r'[\ufe00-\ufe0f\U000e0100-\U000e01ef]?')
 
+# Prebound method for the non-NumPy counting fallback.
+_han_finditer = ALL_HAN_RE.finditer
+
+# The codepoint ranges of ALL_HAN_RE, inclusive, for the vectorized counting
+# path. Variation selectors are ignored there: only base characters count.
+_HAN_RANGES = (
+    (0x4e00, 0x9fff), (0x3400, 0x4dbf), (0x20000, 0x2a6df),
+    (0x2a700, 0x2ebef), (0x30000, 0x323af), (0xfa0e, 0xfa0f),
+    (0xfa11, 0xfa11), (0xfa13, 0xfa14), (0xfa1f, 0xfa1f), (0xfa21, 0xfa21),
+    (0xfa23, 0xfa24), (0xfa27, 0xfa29), (0x3006, 0x3007),
+)
+
+
+def _hant_length(segment: str) -> int:
+    """
+    Return the number of Han characters in a segment.
+
+    With NumPy installed, the segment is viewed as a codepoint array and the
+    Han ranges are counted with boolean masks in C; otherwise the count falls
+    back to a regex scan.
+
+    Args:
+        segment (str): The segment of text to be analyzed.
+
+    Returns:
+        int: The number of Han characters in the segment.
+    """
+    if np is not None:
+        cp = np.frombuffer(segment.encode('utf-32-le'), dtype=np.uint32)
+        mask = np.zeros(cp.shape, dtype=bool)
+        for lo, hi in _HAN_RANGES:
+            mask |= (cp >= lo) & (cp <= hi)
+        return int(mask.sum())
+    return sum(1 for _ in _han_finditer(segment))
+
+
+def _build_hyperscan_db():
+    """
+    Compile the four feature patterns into one Hyperscan database.
+
+    The pattern ids follow the usual category order: 0=canto_exclude,
+    1=swc_exclude, 2=canto_feature, 3=swc_feature.
+
+    Returns:
+        The compiled database, or None when hyperscan is not installed.
+    """
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode('utf-8') for p in
+                     (CANTO_EXCLUDE, SWC_EXCLUDE, CANTO_FEATURE, SWC_FEATURE)],
+        ids=[0, 1, 2, 3],
+        flags=[hyperscan.HS_FLAG_UTF8] * 4)
+    return db
+
+
+# Module-level so that detectors stay picklable and share one database. None
+# until enable_hyperscan is called: the backend is opt-in, not
+# default-when-installed, because its counts are approximate (see below).
+_HS_DB = None
+
+
+def enable_hyperscan() -> None:
+    """
+    Switch feature counting to the Hyperscan backend.
+
+    Hyperscan reports every match of every pattern instead of consuming the
+    matched span the way the regex scans do, so overlapping alternatives are
+    all counted (e.g. 唔好 counts both 唔 and 唔好, where the other backends
+    count one match) and exclusions are subtracted rather than consumed. The
+    counts are therefore an approximation that skews on feature-dense text;
+    the single vectorized pass is worth it for bulk processing of long
+    documents, but it has to be requested explicitly.
+
+    Raises:
+        ImportError: If the hyperscan package is not installed.
+    """
+    global _HS_DB
+    if hyperscan is None:
+        raise ImportError(
+            'the hyperscan package is required for enable_hyperscan()')
+    _HS_DB = _build_hyperscan_db()
+    # Cached judgements were computed by another backend; drop them.
+    _judge_segment_impl.cache_clear()
+
+
+def _on_hyperscan_match(id_, from_, to, flags, counts) -> int:
+    counts[id_] += 1
+    return 0
+
+
+def _count_features(segment: str) -> Tuple[int, int]:
+    """
+    Count the Cantonese and SWC features in a segment, exclusions applied.
+
+    Args:
+        segment (str): The segment of text to be analyzed.
+
+    Returns:
+        Tuple[int, int]: The Cantonese and SWC feature counts.
+    """
+    counts = [0, 0, 0, 0]
+    if _HS_DB is not None:
+        # One vectorized pass over all four patterns. Hyperscan reports every
+        # match, so exclusions are subtracted rather than consumed in place.
+        _HS_DB.scan(segment.encode('utf-8'),
+                    match_event_handler=_on_hyperscan_match, context=counts)
+        return counts[2] - counts[0], counts[3] - counts[1]
+    if _AC_AUTOMATON is not None:
+        # The automaton reports every occurrence in one C pass; replay the
+        # regex engine's leftmost, first-alternative selection over each
+        # category pair's matches independently to get identical counts.
+        canto_matches = []
+        swc_matches = []
+        for end, entries in _AC_AUTOMATON.iter(segment):
+            for priority, length, category in entries:
+                match = (end - length + 1, priority, length, category)
+                if category & 1:
+                    swc_matches.append(match)
+                else:
+                    canto_matches.append(match)
+        for matches in (canto_matches, swc_matches):
+            matches.sort()
+            next_pos = 0
+            for start, _, length, category in matches:
+                if start >= next_pos:
+                    counts[category] += 1
+                    next_pos = start + length
+        return counts[2], counts[3]
+    if _matcher_gen is not None:
+        # The generated dispatch walker avoids per-match object construction,
+        # which makes it faster than driving finditer from Python.
+        counts = _matcher_gen.count_features(segment)
+        return counts[2], counts[3]
+    if _canto_b_finditer is not None:
+        # Encode once and let RE2 scan the UTF-8 bytes directly. Group 2 of
+        # each fused pattern is the feature branch.
+        segment_b = segment.encode('utf-8')
+        return (sum(1 for m in _canto_b_finditer(segment_b) if m.lastindex == 2),
+                sum(1 for m in _swc_b_finditer(segment_b) if m.lastindex == 2))
+    return (sum(1 for m in _canto_finditer(segment) if m.lastindex == 2),
+            sum(1 for m in _swc_finditer(segment) if m.lastindex == 2))
+
+
+def _expand_alternatives(source: str) -> list:
+    """
+    Expand a feature pattern into its literal alternatives, in pattern order.
+
+    The feature patterns only use alternation, plain characters and character
+    classes (no ranges, quantifiers or backreferences), so every alternative
+    like '唔[係得]' expands to a finite list of literal strings. Pattern order
+    is preserved because the regex engine tries alternatives left to right.
+
+    Args:
+        source (str): The pattern source to expand.
+
+    Returns:
+        list: The literal alternatives as plain strings.
+    """
+    source = source.removeprefix('(?:').removesuffix(')')
+    literals = []
+    for alternative in source.split('|'):
+        parts = []
+        i = 0
+        while i < len(alternative):
+            if alternative[i] == '[':
+                end = alternative.index(']', i)
+                parts.append(alternative[i + 1:end])
+                i = end + 1
+            else:
+                parts.append(alternative[i])
+                i += 1
+        literals.extend(''.join(chars) for chars in itertools.product(*parts))
+    return literals
+
+
+def _build_aho_corasick():
+    """
+    Build one Aho-Corasick automaton over the expanded pattern literals.
+
+    Each word carries a tuple of (priority, length, category) entries, at most
+    one per category pair, where priority is the alternative order and the
+    categories follow the usual ids (0=canto_exclude, 1=swc_exclude,
+    2=canto_feature, 3=swc_feature). The pairs are matched independently, so
+    a literal like 是但 that is both a Cantonese feature and an SWC exclusion
+    needs an entry for each pair; within a pair, a repeated literal keeps its
+    first entry, which is the only one the regex engine could ever match.
+
+    Returns:
+        The automaton, or None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    words = {}
+    priority = 0
+    for category, source in enumerate(
+            (CANTO_EXCLUDE, SWC_EXCLUDE, CANTO_FEATURE, SWC_FEATURE)):
+        for literal in _expand_alternatives(source):
+            entries = words.setdefault(literal, [])
+            if not any(entry[2] & 1 == category & 1 for entry in entries):
+                entries.append((priority, len(literal), category))
+            priority += 1
+    automaton = ahocorasick.Automaton()
+    for literal, entries in words.items():
+        automaton.add_word(literal, tuple(entries))
+    automaton.make_automaton()
+    return automaton
+
+
+_AC_AUTOMATON = _build_aho_corasick()
+
+
+def _build_match_tables():
+    """
+    Flatten the expanded pattern literals into arrays for the numba kernel.
+
+    Candidates are grouped by first codepoint; within a group they keep
+    category order (canto_exclude, swc_exclude, canto_feature, swc_feature,
+    each in source order), so filtering a group to one category pair yields
+    that pair's fused-pattern alternative order and the kernel takes the same
+    match as the per-category regex scan at every position.
+
+    Returns:
+        tuple: The NumPy arrays consumed by _match_kernel.
+    """
+    sources = (CANTO_EXCLUDE, SWC_EXCLUDE, CANTO_FEATURE, SWC_FEATURE)
+    groups = {}
+    for category, source in enumerate(sources):
+        for literal in _expand_alternatives(source):
+            groups.setdefault(ord(literal[0]), []).append((category, literal))
+    first_chars = np.array(sorted(groups), dtype=np.uint32)
+    group_start, group_end = [], []
+    cand_offsets, cand_lengths, cand_cats, cand_chars = [], [], [], []
+    for first in first_chars:
+        group_start.append(len(cand_offsets))
+        for category, literal in groups[int(first)]:
+            cand_offsets.append(len(cand_chars))
+            cand_lengths.append(len(literal))
+            cand_cats.append(category)
+            cand_chars.extend(ord(c) for c in literal)
+        group_end.append(len(cand_offsets))
+
+    han_lo = np.array([lo for lo, _ in _HAN_RANGES], dtype=np.uint32)
+    han_hi = np.array([hi for _, hi in _HAN_RANGES], dtype=np.uint32)
+    return (first_chars,
+            np.array(group_start, dtype=np.int32),
+            np.array(group_end, dtype=np.int32),
+            np.array(cand_offsets, dtype=np.int32),
+            np.array(cand_lengths, dtype=np.int32),
+            np.array(cand_cats, dtype=np.int32),
+            np.array(cand_chars, dtype=np.uint32),
+            han_lo, han_hi)
+
+
+if njit is not None and np is not None:
+    _MATCH_TABLES = _build_match_tables()
+
+    @njit(cache=True)
+    def _match_kernel(cp, first_chars, group_start, group_end,
+                      cand_offsets, cand_lengths, cand_cats, cand_chars,
+                      han_lo, han_hi):
+        """
+        Count Han characters and feature matches over a codepoint array.
+
+        The Cantonese pair (categories 0 and 2) and the SWC pair (1 and 3)
+        are walked independently, each with its own consumption position, so
+        an exclusion only hides matches of its own category.
+
+        Returns (canto_exclude, swc_exclude, canto_feature, swc_feature, han).
+        """
+        n = cp.shape[0]
+        han = 0
+        for i in range(n):
+            ch = cp[i]
+            for r in range(han_lo.shape[0]):
+                if han_lo[r] <= ch and ch <= han_hi[r]:
+                    han += 1
+                    break
+
+        counts = np.zeros(4, dtype=np.int64)
+        next0 = 0
+        next1 = 0
+        i = 0
+        while i < n:
+            if i < next0 and i < next1:
+                # Both pairs have consumed past here; skip to the nearer end.
+                i = next0 if next0 < next1 else next1
+                continue
+            ch = cp[i]
+            g = np.searchsorted(first_chars, ch)
+            if g < first_chars.shape[0] and first_chars[g] == ch:
+                matched0 = i < next0
+                matched1 = i < next1
+                for k in range(group_start[g], group_end[g]):
+                    category = cand_cats[k]
+                    if (matched1 if category & 1 else matched0):
+                        continue
+                    length = cand_lengths[k]
+                    if i + length <= n:
+                        offset = cand_offsets[k]
+                        matched = True
+                        for t in range(1, length):
+                            if cp[i + t] != cand_chars[offset + t]:
+                                matched = False
+                                break
+                        if matched:
+                            counts[category] += 1
+                            if category & 1:
+                                matched1 = True
+                                next1 = i + length
+                            else:
+                                matched0 = True
+                                next0 = i + length
+                            if matched0 and matched1:
+                                break
+            i += 1
+        return counts[0], counts[1], counts[2], counts[3], han
+else:
+    _MATCH_TABLES = None
+    _match_kernel = None
+
+
+def _analyze_segment(segment: str) -> Tuple[int, int, int]:
+    """
+    Return the Cantonese feature count, SWC feature count and Han length.
+
+    With Numba available, everything is computed by one compiled pass over the
+    segment's codepoint array; otherwise the Han length is counted first so
+    that Han-free segments skip the feature scan.
+
+    Args:
+        segment (str): The segment of text to be analyzed.
+
+    Returns:
+        Tuple[int, int, int]: The Cantonese count, SWC count and Han length.
+    """
+    if _match_kernel is not None:
+        cp = np.frombuffer(segment.encode('utf-32-le'), dtype=np.uint32)
+        _, _, canto_count, swc_count, length = _match_kernel(
+            cp, *_MATCH_TABLES)
+        return canto_count, swc_count, length
+
+    length = _hant_length(segment)
+    if length == 0:
+        return 0, 0, 0
+    canto_count, swc_count = _count_features(segment)
+    return canto_count, swc_count, length
+
+
+# Thresholds are scaled to integers on this grid so that the per-segment
+# comparisons stay in pure integer arithmetic.
+_THRESHOLD_SCALE = 10000
+
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """
+    The detector thresholds, scaled to integers on _THRESHOLD_SCALE.
+
+    Frozen with slots: reads are C-level offsets rather than dict lookups, the
+    instance is hashable for the memoized judgement, and it can be shared
+    freely across threads and worker processes.
+    """
+    canto_tolerance_scaled: int
+    swc_tolerance_scaled: int
+    canto_presence_scaled: int
+    swc_presence_scaled: int
+
+
+def _build_decision_lut() -> Tuple[str, ...]:
+    """
+    Precompute the segment label for every combination of the six decision bits.
+
+    Bit order: 0=lack_swc, 1=lack_canto, 2=has_canto, 3=has_swc,
+    4=canto_pref, 5=swc_pref.
+
+    Returns:
+        Tuple[str, ...]: The 64-entry label table.
+    """
+    lut = []
+    for key in range(64):
+        lack_swc = bool(key & 1)
+        lack_canto = bool(key & 2)
+        has_canto = bool(key & 4)
+        has_swc = bool(key & 8)
+        canto_pref = bool(key & 16)
+        swc_pref = bool(key & 32)
+
+        if lack_canto and lack_swc:
+            lut.append("Neutral")
+        elif canto_pref and not has_swc:
+            lut.append("Cantonese")
+        elif swc_pref and not has_canto:
+            lut.append("SWC")
+        else:
+            lut.append("Mixed")
+    return tuple(lut)
+
+
+_DECISION_LUT = _build_decision_lut()
+
+
+@functools.lru_cache(maxsize=8192)
+def _judge_segment_impl(segment: str, config: _Config) -> str:
+    """
+    Determine the language of a segment based on the presence of Cantonese and SWC features.
+
+    If the Cantonese feature presence are above the threshold, and the Mandarin feature is below the threshold, then it's Cantonese.
+    If the Cantonese feature presence are below the threshold, and the Mandarin feature is above the threshold, then it's SWC.
+    If both Cantonese and SWC features are below the threshold, then it's Neutral text.
+    If both Cantonese and SWC features are above the threshold, then it's Mixed.
+
+    Real-world text repeats many short segments (greetings, names, stock
+    phrases), so results are memoized on the segment and thresholds.
+
+    Args:
+        segment (str): The segment of text to be judged.
+        config (_Config): The scaled detector thresholds.
+
+    Returns:
+        str: The language of the segment (Cantonese, SWC, Neutral, or Mixed).
+    """
+    canto_feature_count, swc_feature_count, length = _analyze_segment(segment)
+    if length == 0:
+        return "Neutral"
+
+    num_all_features: int = canto_feature_count + swc_feature_count
+    count_diff: int = canto_feature_count - swc_feature_count
+
+    # For an integer count, count <= floor(t * length) and count >= ceil(p *
+    # length) are equivalent to these pure-integer comparisons on the scaled
+    # thresholds; likewise the preference ratio (c - s) / (c + s) > 0.9 is
+    # 10 * (c - s) > 9 * (c + s). Pack the six decision bits into a key and
+    # look the label up in the precomputed table instead of branching.
+    # A segment with no features at all lacks both, so the table yields
+    # Neutral without a separate check.
+    key = (
+        (swc_feature_count * _THRESHOLD_SCALE <= config.swc_tolerance_scaled * length)
+        | (canto_feature_count * _THRESHOLD_SCALE <= config.canto_tolerance_scaled * length) << 1
+        | (canto_feature_count * _THRESHOLD_SCALE >= config.canto_presence_scaled * length) << 2
+        | (swc_feature_count * _THRESHOLD_SCALE >= config.swc_presence_scaled * length) << 3
+        | (10 * count_diff > 9 * num_all_features) << 4
+        | (-10 * count_diff > 9 * num_all_features) << 5
+    )
+    return _DECISION_LUT[key]
+
 
 class CantoneseDetector:
     """
@@ -88,6 +656,14 @@ class CantoneseDetector:
         # The minimum SWC features expected to be found in Mixed or SWC text.
         self.swc_presence: float = swc_presence
 
+        # Thresholds scaled to integers once and frozen, so the per-segment
+        # judgement compares pure integers and shares one immutable config.
+        self._config = _Config(
+            canto_tolerance_scaled=round(canto_tolerance * _THRESHOLD_SCALE),
+            swc_tolerance_scaled=round(swc_tolerance * _THRESHOLD_SCALE),
+            canto_presence_scaled=round(canto_presence * _THRESHOLD_SCALE),
+            swc_presence_scaled=round(swc_presence * _THRESHOLD_SCALE))
+
     def _hant_length(self, segment: str) -> int:
         """
         Return the number of Han characters in a segment.
@@ -98,7 +674,7 @@ class CantoneseDetector:
         Returns:
             int: The number of Han characters in the segment.
         """
-        return sum(1 for _ in ALL_HAN_RE.finditer(segment))
+        return _hant_length(segment)
 
     def _separate_quotes(self, document: str) -> Tuple[str, str]:
         """
@@ -110,35 +686,49 @@ class CantoneseDetector:
         Returns:
             quotes (Tuple[str, str]): A tuple containing the matrix and quotes extracted from the document.
         """
-        matrix = re.sub(ALL_QUOTEMARKS_RE, "…", document)
-        quote_segments = re.findall(ALL_QUOTEMARKS_RE, document)
-        quotes = "…".join(["".join(s) for s in quote_segments])
-
-        return matrix, quotes
-
-    def _get_segment_features(self, segment: str) -> SegmentFeatures:
+        # One finditer pass builds the matrix and collects the quote contents
+        # at the same time, instead of a sub pass followed by a findall pass.
+        matrix_parts = []
+        quote_contents = []
+        last = 0
+        for match in ALL_QUOTEMARKS_RE.finditer(document):
+            matrix_parts.append(document[last:match.start()])
+            matrix_parts.append("…")
+            quote_contents.append(match.group(match.lastindex))
+            last = match.end()
+        matrix_parts.append(document[last:])
+
+        return "".join(matrix_parts), "…".join(quote_contents)
+
+    def _get_segment_features(self, segment: str, with_matches: bool = False) -> SegmentFeatures:
         """
         Extract and set Cantonese and SWC features in a segment.
 
         Args:
             segment (str): The segment of text to be analyzed.
+            with_matches (bool): Also materialize the matched strings, for
+                inspection with SegmentFeatures.print_analysis. The judgement
+                only needs the counts, so this defaults to False.
 
         Returns:
-            None
+            SegmentFeatures: The features extracted from the segment.
         """
-        canto_feature = CANTO_FEATURE_RE.findall(segment)
-        canto_exclude = CANTO_EXCLUDE_RE.findall(segment)
-        swc_feature = SWC_FEATURE_RE.findall(segment)
-        swc_exclude = SWC_EXCLUDE_RE.findall(segment)
-
-        canto_feature_count: int = len(canto_feature) - len(canto_exclude)
-        swc_feature_count: int = len(swc_feature) - len(swc_exclude)
-
-        # len for faster execution
-        length = self._hant_length(segment)
-
-        segment_features = SegmentFeatures(segment, canto_feature, canto_exclude, swc_feature,
-                                           swc_exclude, canto_feature_count, swc_feature_count, length)
+        canto_feature_count, swc_feature_count, length = _analyze_segment(
+            segment)
+        if length == 0:
+            return SegmentFeatures(segment, 0, 0, 0)
+
+        if with_matches:
+            # Debugging only: rerun the individual patterns to list matches.
+            return SegmentFeatures(
+                segment, canto_feature_count, swc_feature_count, length,
+                canto_feature=CANTO_FEATURE_RE.findall(segment),
+                canto_exclude=CANTO_EXCLUDE_RE.findall(segment),
+                swc_feature=SWC_FEATURE_RE.findall(segment),
+                swc_exclude=SWC_EXCLUDE_RE.findall(segment))
+
+        segment_features = SegmentFeatures(
+            segment, canto_feature_count, swc_feature_count, length)
 
         return segment_features
 
@@ -146,47 +736,39 @@ class CantoneseDetector:
         """
         Determine the language of a segment based on the presence of Cantonese and SWC features.
 
-        If the Cantonese feature presence are above the threshold, and the Mandarin feature is below the threshold, then it's Cantonese.
-        If the Cantonese feature presence are below the threshold, and the Mandarin feature is above the threshold, then it's SWC.
-        If both Cantonese and SWC features are below the threshold, then it's Neutral text.
-        If both Cantonese and SWC features are above the threshold, then it's Mixed.
+        Thin wrapper over the memoized module-level implementation.
 
         Args:
             segment (str): The segment of text to be judged.
 
         Returns:
-            tuple: A tuple containing the language of the segment (Cantonese, SWC, Neutral, or Mixed), 
-                the count of Cantonese features in the segment, the count of SWC features in the segment, 
-                and the length of the segment in Han characters.
+            str: The language of the segment (Cantonese, SWC, Neutral, or Mixed).
         """
-        features: SegmentFeatures = self._get_segment_features(segment)
+        return _judge_segment_impl(segment, self._config)
 
-        num_all_features: int = features.canto_feature_count + features.swc_feature_count
+    def _iter_segments(self, document: str):
+        """
+        Yield the non-empty segments of a document, stripped, lazily.
 
-        lack_swc: bool = features.swc_feature_count <= math.floor(
-            self.swc_tolerance * features.length)
-        lack_canto: bool = features.canto_feature_count <= math.floor(
-            self.canto_tolerance * features.length)
+        Walking the delimiter matches avoids materializing the full segment
+        list that re.split would build, so peak memory stays constant on long
+        documents.
 
-        if num_all_features == 0 or (lack_canto and lack_swc):
-            return "Neutral"
-        else:
-            has_canto: bool = features.canto_feature_count >= math.ceil(
-                self.canto_presence * features.length)
-            has_swc: bool = features.swc_feature_count >= math.ceil(
-                self.swc_presence * features.length)
-
-            canto_pref: bool = features.canto_feature_count / num_all_features - \
-                features.swc_feature_count / num_all_features > 0.9
-            swc_pref: bool = features.swc_feature_count / num_all_features - \
-                features.canto_feature_count / num_all_features > 0.9
-
-            if canto_pref and not has_swc:
-                return "Cantonese"
-            elif swc_pref and not has_canto:
-                return "SWC"
-            else:
-                return "Mixed"
+        Args:
+            document (str): The document to be segmented.
+
+        Yields:
+            str: The next non-empty segment.
+        """
+        last = 0
+        for match in ALL_DELIMITERS_RE.finditer(document):
+            segment = document[last:match.start()].strip()
+            if segment:
+                yield segment
+            last = match.end()
+        tail = document[last:].strip()
+        if tail:
+            yield tail
 
     def _judge_segments(self, document: str) -> str:
         """
@@ -202,20 +784,23 @@ class CantoneseDetector:
         Returns:
             str: The aggregated judgement of the segments.
         """
-        segments = filter(lambda x: x.strip(),
-                          ALL_DELIMITERS_RE.split(document))
-
-        judgements = [self._judge_single_segment(
-            segment) for segment in segments]
-
-        judgements_counter: Counter = Counter(judgements)
-
-        canto_seg_count: int = judgements_counter["Cantonese"]
-        swc_seg_count: int = judgements_counter["SWC"]
-        neutral_seg_count: int = judgements_counter["Neutral"]
+        # Only four labels exist, so count them into plain integers instead of
+        # materializing a judgement list and building a Counter.
+        canto_seg_count = swc_seg_count = neutral_seg_count = mixed_seg_count = 0
+        for segment in self._iter_segments(document):
+            judgement = self._judge_single_segment(segment)
+            if judgement == "Cantonese":
+                canto_seg_count += 1
+            elif judgement == "SWC":
+                swc_seg_count += 1
+            elif judgement == "Neutral":
+                neutral_seg_count += 1
+            else:
+                mixed_seg_count += 1
 
         # 95% threshold
-        threshold = math.ceil(sum(judgements_counter.values()) * 0.95)
+        threshold = math.ceil(
+            (canto_seg_count + swc_seg_count + neutral_seg_count + mixed_seg_count) * 0.95)
 
         canto_only: bool = canto_seg_count + neutral_seg_count >= threshold
         swc_only: bool = swc_seg_count + neutral_seg_count >= threshold
@@ -248,8 +833,9 @@ class CantoneseDetector:
         matrix, quotes = self._separate_quotes(document)
 
         if matrix == "…":
-            # Matrix is empty, entire input is a quote
-            return self._judge_document(ALL_QUOTEMARKS_RE.sub("", quotes))
+            # Matrix is empty, entire input is a quote. _separate_quotes already
+            # stripped the outer quote marks, so judge the contents directly.
+            return self._judge_document(quotes)
         elif quotes == "":
             # No quotes
             return self._judge_document(matrix)
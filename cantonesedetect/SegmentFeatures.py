@@ -1,22 +1,24 @@
-from typing import List
+from typing import List, Optional
 
 
 class SegmentFeatures:
-    def __init__(self, segment, canto_feature, canto_exclude, swc_feature,
-                 swc_exclude, canto_feature_count, swc_feature_count, length) -> None:
+    def __init__(self, segment, canto_feature_count, swc_feature_count, length,
+                 canto_feature=None, canto_exclude=None, swc_feature=None, swc_exclude=None) -> None:
         self.segment: str = segment
 
-        self.canto_feature: List[str] = canto_feature
-        self.canto_exclude: List[str] = canto_exclude
-        self.swc_feature: List[str] = swc_feature
-        self.swc_exclude: List[str] = swc_exclude
+        # Only the counts are used for judgement; the match lists are optional
+        # and only carried for inspection.
+        self.canto_feature: Optional[List[str]] = canto_feature
+        self.canto_exclude: Optional[List[str]] = canto_exclude
+        self.swc_feature: Optional[List[str]] = swc_feature
+        self.swc_exclude: Optional[List[str]] = swc_exclude
 
         self.canto_feature_count: int = canto_feature_count
         self.swc_feature_count: int = swc_feature_count
         self.length: int = length
 
-        self.canto_ratio: float = canto_feature_count / length
-        self.swc_ratio: float = swc_feature_count / length
+        self.canto_ratio: float = canto_feature_count / length if length else 0.0
+        self.swc_ratio: float = swc_feature_count / length if length else 0.0
 
     def print_analysis(self, print_features=False) -> None:
         """
@@ -31,9 +33,9 @@ class SegmentFeatures:
         print(f"{self.segment} ({self.length} Han characters)")
 
         print(f"Cantonese features: {self.canto_feature_count}")
-        if print_features:
+        if print_features and self.canto_feature is not None:
             print(self.canto_feature)
 
         print(f"SWC features {self.swc_feature_count}")
-        if print_features:
+        if print_features and self.swc_feature is not None:
             print(self.swc_feature)
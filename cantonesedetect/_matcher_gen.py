@@ -0,0 +1,340 @@
+"""
+Literal-dispatch feature matcher. Auto-generated by tools/build_matcher.py
+from the patterns in Detector.py; do not edit by hand.
+
+_DISPATCH maps a first character to its candidate literals in category order,
+each tagged with a category id (0=canto_exclude, 1=swc_exclude,
+2=canto_feature, 3=swc_feature). The Cantonese pair (0, 2) and the SWC pair
+(1, 3) are matched independently of each other; count_features walks a
+segment once with one consumption position per pair, taking the same
+leftmost first-alternative match as that pair's regex scan at every position.
+"""
+
+SOURCE_HASH = '3019d793c42db9a2f29986d5b291bdfdc9f309e7'
+
+# Single-character features, per category, that occur in no multi-character
+# literal of their own category pair: their totals are independent of the
+# match walk, so str.count can tally them with C-level scans.
+_INDEPENDENT_SINGLES = (
+    '',
+    '',
+    '冧嘅嗰啲咗佢喺咁噉冇啩哋畀嚟惗乜嘢閪撚𨳍𨳊瞓睇㗎餸𨋢摷喎嚿噃嚡嘥嗮啱揾搵喐逳噏𢳂岋糴揈捹撳㩒𥄫攰癐冚孻𡃁跣𨃩瀡氹嬲掟孭黐唞㪗埞忟𢛴嗱',
+    '這哪唄咱啥甭她麼么',
+)
+
+_DISPATCH = {
+    '㗎': ((2, '㗎'),),
+    '㩒': ((2, '㩒'),),
+    '㪗': ((2, '㪗'),),
+    '一': ((1, '一把年紀'),),
+    '三': ((1, '三把'),),
+    '下': ((1, '下把位'),),
+    '不': ((1, '不得了'), (1, '不由分說'), (1, '不由分説'),),
+    '中': ((1, '中的'),),
+    '么': ((3, '么'),),
+    '之': ((1, '之乎者也'),),
+    '乜': ((2, '乜'),),
+    '也': ((1, '也許'), (1, '也門'), (1, '也文也武'), (3, '也'),),
+    '了': ((1, '了結'), (1, '了無'), (1, '了斷'), (1, '了當'), (1, '了然'), (1, '了哥'), (1, '了得'), (1, '了解'), (1, '了事'), (1, '了之'), (3, '了'),),
+    '五': ((1, '五把'),),
+    '些': ((3, '些'),),
+    '亞': ((1, '亞利桑那'),),
+    '他': ((1, '他信'), (1, '他人'), (1, '他國'), (1, '他日'), (1, '他殺'), (1, '他鄉'), (1, '他加祿'), (1, '他山之石'), (3, '他'),),
+    '仲': ((2, '仲有'), (2, '仲係'), (2, '仲話'), (2, '仲要'), (2, '仲得'), (2, '仲好'), (2, '仲衰'), (2, '仲唔'),),
+    '似': ((1, '似是而非'),),
+    '佢': ((2, '佢'),),
+    '依': ((2, '依家'),),
+    '係': ((2, '係'),),
+    '俯': ((1, '俯拾皆是'),),
+    '俾': ((0, '俾路支'), (0, '俾斯麥'), (2, '俾'),),
+    '假': ((1, '假説'), (1, '假說'),),
+    '健': ((1, '健在'),),
+    '傳': ((1, '傳説'), (1, '傳說'),),
+    '傾': ((2, '傾掂'), (2, '傾偈'), (2, '傾計'),),
+    '內': ((1, '內在'),),
+    '兩': ((1, '兩把'),),
+    '其': ((1, '其他'), (1, '其它'),),
+    '冇': ((2, '冇'),),
+    '冚': ((2, '冚'),),
+    '冧': ((1, '冧把'), (2, '冧'),),
+    '凍': ((2, '凍親'), (2, '凍嚫'),),
+    '出': ((1, '出沒'),),
+    '利': ((1, '利是'), (1, '利他'),),
+    '剎': ((1, '剎那'),),
+    '剩': ((2, '剩低'),),
+    '加': ((1, '加把'),),
+    '勁': ((2, '勁秋'), (2, '勁抽'),),
+    '勝': ((1, '勝在'),),
+    '印': ((1, '印第安那'),),
+    '卻': ((1, '卻步'), (3, '卻'),),
+    '去': ((2, '去邊'),),
+    '又': ((2, '又係'),),
+    '吃': ((1, '吃虧'), (1, '吃苦'), (1, '吃力'), (3, '吃'),),
+    '同': ((2, '同埋'),),
+    '吧': ((1, '吧台'), (1, '吧臺'), (1, '吧枱'), (1, '吧檯'), (3, '吧'),),
+    '吱': ((0, '吱唔'),),
+    '咁': ((2, '咁'),),
+    '咗': ((2, '咗'),),
+    '咱': ((3, '咱'),),
+    '咿': ((0, '咿唔'),),
+    '哈': ((1, '哈瓦那'),),
+    '哋': ((2, '哋'),),
+    '哪': ((3, '哪'),),
+    '唄': ((3, '唄'),),
+    '唔': ((2, '唔'), (2, '唔係'), (2, '唔得'), (2, '唔會'), (2, '唔好'), (2, '唔識'), (2, '唔使'), (2, '唔洗'), (2, '唔駛'), (2, '唔通'), (2, '唔知'), (2, '唔到'), (2, '唔去'), (2, '唔走'), (2, '唔掂'), (2, '唔該'), (2, '唔錯'), (2, '唔差'),),
+    '唞': ((2, '唞'),),
+    '唯': ((1, '唯命是從'), (1, '唯才是用'),),
+    '啥': ((3, '啥'),),
+    '啩': ((2, '啩'),),
+    '啱': ((2, '啱'),),
+    '啲': ((2, '啲'),),
+    '喇': ((0, '喇嘛'), (0, '喇叭'), (2, '喇'),),
+    '喎': ((2, '喎'),),
+    '喐': ((2, '喐'),),
+    '喺': ((2, '喺'),),
+    '嗮': ((2, '嗮'),),
+    '嗰': ((2, '嗰'),),
+    '嗱': ((2, '嗱'),),
+    '嘅': ((2, '嘅'),),
+    '嘢': ((2, '嘢'),),
+    '嘥': ((2, '嘥'),),
+    '噃': ((2, '噃'),),
+    '噉': ((2, '噉'),),
+    '噏': ((2, '噏'),),
+    '噚': ((2, '噚日'),),
+    '嚇': ((2, '嚇親'), (2, '嚇嚫'),),
+    '嚟': ((2, '嚟'),),
+    '嚡': ((2, '嚡'),),
+    '嚫': ((2, '嚫'),),
+    '嚿': ((2, '嚿'),),
+    '四': ((1, '四把'),),
+    '在': ((1, '在場'), (1, '在乎'), (1, '在下'), (1, '在校'), (1, '在學'), (1, '在行'), (1, '在任'), (1, '在野'), (1, '在意'), (1, '在於'), (1, '在望'), (1, '在內'), (1, '在案'), (1, '在旁'), (1, '在生'), (1, '在世'), (1, '在心'), (1, '在線'), (1, '在逃'), (1, '在位'), (1, '在即'), (1, '在職'), (1, '在座'), (1, '在囚'), (1, '在此'), (1, '在家'), (3, '在'),),
+    '坐': ((2, '坐低'),),
+    '埋': ((1, '埋沒'),),
+    '埞': ((2, '埞'),),
+    '執': ((2, '執好'), (2, '執生'), (2, '執實'), (2, '執返'), (2, '執輸'),),
+    '外': ((1, '外在'),),
+    '大': ((1, '大眼的度'), (1, '大不了'), (1, '大把'),),
+    '她': ((3, '她'),),
+    '好': ((1, '好在'),),
+    '威': ((1, '威也'),),
+    '嬲': ((2, '嬲'),),
+    '存': ((1, '存在'),),
+    '孭': ((2, '孭'),),
+    '學': ((1, '學説'), (1, '學說'),),
+    '孻': ((2, '孻'),),
+    '它': ((3, '它'),),
+    '家': ((2, '家下'), (2, '家陣'),),
+    '實': ((1, '實在'), (2, '實係'),),
+    '尋': ((2, '尋日'),),
+    '小': ((1, '小説'), (1, '小說'),),
+    '就': ((2, '就係'),),
+    '屋': ((2, '屋企'),),
+    '岋': ((2, '岋'),),
+    '差': ((1, '差在'),),
+    '巴': ((1, '巴塞羅那'),),
+    '幫': ((2, '幫襯'),),
+    '幾': ((1, '幾把'),),
+    '弄': ((1, '弄堂把握'), (1, '弄堂把柄'), (1, '弄堂把持'), (1, '弄堂把火'), (1, '弄堂把風'), (1, '弄堂把關'), (1, '弄堂把鬼'), (1, '弄堂把口'), (1, '弄堂把嘴'), (1, '弄堂把戲'), (1, '弄堂把脈'), (1, '弄堂把炮'), (1, '弄堂把砲'), (1, '弄堂把屁'), (1, '弄堂把手'), (1, '弄堂把聲'), (3, '弄'),),
+    '弊': ((1, '弊在'),),
+    '得': ((1, '得把'), (2, '得掂'),),
+    '志': ((1, '志在'),),
+    '忘': ((1, '忘卻'),),
+    '忟': ((2, '忟'),),
+    '念': ((1, '念在'),),
+    '惗': ((2, '惗'),),
+    '慳': ((2, '慳錢'),),
+    '我': ((1, '我思故我在'),),
+    '所': ((1, '所在'),),
+    '把': ((1, '把死人聲'), (3, '把'),),
+    '拉': ((1, '拉把'),),
+    '拎': ((1, '拎把'),),
+    '拖': ((1, '拖把'),),
+    '捹': ((2, '捹'),),
+    '掃': ((1, '掃把'),),
+    '排': ((1, '排他'),),
+    '掟': ((2, '掟'),),
+    '揈': ((2, '揈'),),
+    '揩': ((2, '揩親'), (2, '揩嚫'),),
+    '揾': ((2, '揾'),),
+    '搞': ((2, '搞掂'),),
+    '搵': ((2, '搵'),),
+    '摷': ((2, '摷'),),
+    '撚': ((2, '撚'),),
+    '撩': ((1, '撩是鬥非'),),
+    '撳': ((2, '撳'),),
+    '攝': ((2, '攝親'), (2, '攝嚫'),),
+    '支': ((1, '支那'),),
+    '攰': ((2, '攰'),),
+    '收': ((2, '收皮'),),
+    '整': ((2, '整親'), (2, '整嚫'),),
+    '於': ((1, '於是'),),
+    '旨': ((1, '旨在'),),
+    '明': ((1, '明了'),),
+    '是': ((1, '是否'), (1, '是日'), (1, '是次'), (1, '是非'), (1, '是但'), (1, '是旦'), (2, '是但'), (2, '是旦'), (3, '是'),),
+    '時': ((1, '時也命也'), (1, '時也運也'),),
+    '未': ((1, '未了'),),
+    '核': ((2, '核突'),),
+    '梗': ((2, '梗係'),),
+    '橫': ((2, '橫掂'),),
+    '水': ((1, '水吧'),),
+    '氹': ((2, '氹'),),
+    '求': ((2, '求其'),),
+    '沉': ((1, '沉沒'),),
+    '沒': ((1, '沒沒'), (1, '沒落'), (1, '沒頂'), (1, '沒收'), (3, '沒'),),
+    '沙': ((1, '沙那'),),
+    '波': ((1, '波羅的海'),),
+    '泵': ((1, '泵把'),),
+    '活': ((1, '活在'),),
+    '浸': ((1, '浸沒'), (2, '浸親'), (2, '浸嚫'),),
+    '淥': ((2, '淥親'), (2, '淥嚫'),),
+    '淹': ((1, '淹沒'),),
+    '淺': ((1, '淺説'), (1, '淺說'),),
+    '游': ((1, '游説'), (1, '游說'),),
+    '湮': ((1, '湮沒'),),
+    '溼': ((2, '溼碎'),),
+    '潛': ((1, '潛在'),),
+    '激': ((2, '激親'), (2, '激嚫'),),
+    '濕': ((2, '濕碎'),),
+    '瀡': ((2, '瀡'),),
+    '無': ((1, '無他'),),
+    '爭': ((1, '爭在'),),
+    '現': ((1, '現在'),),
+    '琴': ((2, '琴日'),),
+    '甭': ((3, '甭'),),
+    '畀': ((2, '畀'),),
+    '留': ((2, '留低'),),
+    '癐': ((2, '癐'),),
+    '的': ((1, '的士'), (1, '的確'), (1, '的式'), (1, '的而且確'), (1, '的起心肝些微'), (1, '的起心肝些少'), (1, '的起心肝些許'), (1, '的起心肝些小'), (3, '的'),),
+    '目': ((1, '目的'),),
+    '真': ((2, '真係'),),
+    '眾': ((1, '眾矢之的'), (1, '眾説'), (1, '眾說'),),
+    '睇': ((2, '睇'),),
+    '瞓': ((2, '瞓'),),
+    '神': ((1, '神出鬼沒'),),
+    '空': ((1, '空空如也'),),
+    '站': ((1, '站在'),),
+    '第': ((1, '第一把'), (2, '第日'),),
+    '糴': ((2, '糴'),),
+    '紅': ((1, '紅的'),),
+    '結': ((1, '結他'),),
+    '綠': ((1, '綠的'),),
+    '維': ((1, '維他'), (1, '維也納'),),
+    '網': ((1, '網吧'),),
+    '而': ((2, '而家'), (3, '而已'),),
+    '聽': ((2, '聽日'),),
+    '肉': ((2, '肉赤'), (2, '肉緊'), (2, '肉酸'),),
+    '自': ((1, '自以為是'), (1, '自圓其説'), (1, '自圓其說'), (1, '自把自為'),),
+    '莫': ((1, '莫衷一是'),),
+    '薩': ((1, '薩那'),),
+    '藍': ((1, '藍的'),),
+    '衆': ((1, '衆説'), (1, '衆說'),),
+    '衰': ((1, '衰在'),),
+    '覆': ((1, '覆沒'),),
+    '解': ((1, '解説'), (1, '解說'),),
+    '訴': ((1, '訴説'), (1, '訴說'),),
+    '話': ((2, '話係'),),
+    '說': ((1, '說話'), (1, '說服'), (1, '說明'), (3, '說'),),
+    '説': ((1, '説話'), (1, '説服'), (1, '説明'), (3, '説'),),
+    '論': ((1, '論説'), (1, '論說'),),
+    '諗': ((2, '諗'), (2, '諗掂'),),
+    '貼': ((1, '貼吧'),),
+    '跣': ((2, '跣'),),
+    '返': ((2, '返學'), (2, '返工'), (2, '返去'), (2, '返歸'),),
+    '退': ((1, '退卻'),),
+    '這': ((3, '這'),),
+    '逢': ((2, '逢親'), (2, '逢嚫'),),
+    '逳': ((2, '逳'),),
+    '遊': ((1, '遊説'), (1, '遊說'),),
+    '邊': ((2, '邊度'), (2, '邊個'), (2, '邊位'), (2, '邊科'), (2, '邊隻'), (2, '邊條'), (2, '邊張'), (2, '邊樣'),),
+    '那': ((1, '那不勒斯'), (3, '那'),),
+    '都': ((2, '都係'),),
+    '酒': ((1, '酒吧'),),
+    '長': ((1, '長話短說'), (1, '長話短説'),),
+    '閪': ((2, '閪'),),
+    '關': ((0, '關係'),),
+    '阻': ((1, '阻卻'),),
+    '零': ((2, '零舍'),),
+    '非': ((1, '非也'),),
+    '頭': ((1, '頭頭是道'), (1, '頭也不回'),),
+    '餸': ((2, '餸'),),
+    '馬': ((1, '馬耳他'),),
+    '麼': ((3, '麼'),),
+    '黐': ((2, '黐'),),
+    '點': ((2, '點樣'), (2, '點會'), (2, '點做'), (2, '點得'), (2, '點解'),),
+    '𡃁': ((2, '𡃁'),),
+    '𢛴': ((2, '𢛴'),),
+    '𢳂': ((2, '𢳂'),),
+    '𥄫': ((2, '𥄫'),),
+    '𨃩': ((2, '𨃩'),),
+    '𨋢': ((2, '𨋢'),),
+    '𨳊': ((2, '𨳊'),),
+    '𨳍': ((2, '𨳍'),),
+}
+
+# The dispatch table with the independent-single candidates removed, for the
+# long-segment path where they are counted by str.count instead. A character
+# can be an independent single in one pair and start a phrase of the other,
+# so filtering happens per candidate, not per table entry.
+_PHRASE_DISPATCH = {
+    first: kept for first, kept in (
+        (first, tuple(
+            (category, literal) for category, literal in candidates
+            if len(literal) > 1 or literal not in _INDEPENDENT_SINGLES[category]
+        ))
+        for first, candidates in _DISPATCH.items())
+    if kept
+}
+
+# Above this many characters, one C-level str.count scan per independent single
+# costs less than dispatching on those characters in the Python walk (measured
+# crossover is around 160 characters on CPython 3.11).
+_SINGLE_COUNT_MIN = 200
+
+
+def count_features(s):
+    """
+    Count matches per category in one pass over the segment.
+
+    Args:
+        s (str): The segment of text to scan.
+
+    Returns:
+        tuple: (canto_exclude, swc_exclude, canto_feature, swc_feature) counts.
+    """
+    counts = [0, 0, 0, 0]
+    n = len(s)
+    if n >= _SINGLE_COUNT_MIN:
+        for category, chars in enumerate(_INDEPENDENT_SINGLES):
+            total = 0
+            for c in chars:
+                total += s.count(c)
+            counts[category] = total
+        dispatch_get = _PHRASE_DISPATCH.get
+    else:
+        dispatch_get = _DISPATCH.get
+    canto_next = swc_next = 0
+    i = 0
+    while i < n:
+        if i < canto_next and i < swc_next:
+            i = canto_next if canto_next < swc_next else swc_next
+            continue
+        candidates = dispatch_get(s[i])
+        if candidates is not None:
+            canto_done = i < canto_next
+            swc_done = i < swc_next
+            for category, literal in candidates:
+                if (swc_done if category & 1 else canto_done):
+                    continue
+                if s.startswith(literal, i):
+                    counts[category] += 1
+                    if category & 1:
+                        swc_done = True
+                        swc_next = i + len(literal)
+                    else:
+                        canto_done = True
+                        canto_next = i + len(literal)
+                    if canto_done and swc_done:
+                        break
+        i += 1
+    return counts[0], counts[1], counts[2], counts[3]
@@ -1,5 +1,7 @@
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
 from cantonesedetect.Detector import CantoneseDetector
 
 sys.stdout.reconfigure(encoding='utf-8')
@@ -20,19 +22,36 @@ def main():
         '--quotes', help='Separate quotes from matrix and judge them separately.', action='store_true')
     argparser.add_argument(
         '--split', help='Split the document into segments if True', action='store_true')
+    argparser.add_argument(
+        '--jobs', type=int, default=1,
+        help='Number of worker processes for judging lines. 0 uses all cores. Default is 1 (no pool).')
     args = argparser.parse_args()
 
     detector = CantoneseDetector(split_seg=args.split, get_quote=args.quotes)
 
+    # Read the whole file up front and judge the lines from a list: one read
+    # syscall and no per-line I/O overhead in the hot loop.
     with open(args.input, encoding='utf-8') as f:
-        for line in f:
-            l = line.strip()
-            judgement = detector.judge(l)
-            _line = judgement
-            if args.mode == 'full':
-                _line = _line + f'\t{l}'
-            _line = _line + '\n'
-            sys.stdout.write(_line)
+        lines = [line.strip() for line in f.read().splitlines()]
+
+    # Each line is judged independently, so the work is embarrassingly
+    # parallel; the chunksize amortizes pickling over many short lines.
+    if args.jobs != 1:
+        with ProcessPoolExecutor(max_workers=args.jobs or None) as executor:
+            judgements = list(executor.map(
+                detector.judge, lines, chunksize=256))
+    else:
+        judgements = map(detector.judge, lines)
+
+    output = []
+    for l, judgement in zip(lines, judgements):
+        _line = judgement
+        if args.mode == 'full':
+            _line = _line + f'\t{l}'
+        output.append(_line)
+
+    if output:
+        sys.stdout.write('\n'.join(output) + '\n')
 
 
 if __name__ == '__main__':
@@ -13,5 +13,7 @@ setup(
     packages=find_packages(),
     long_description=long_description,
     long_description_content_type='text/markdown',
+    # dataclass(slots=True) needs 3.10.
+    python_requires='>=3.10',
     test_suite='tests',
 )
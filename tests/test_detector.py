@@ -53,11 +53,26 @@ class TestCantoneseDetector(unittest.TestCase):
         self.assertEqual(self.detector._judge_matrix_quotes(
             "他說「是咁的」"), "MixedQuotesInSWC")
 
+    @pytest.mark.private
+    def test_judge_matrix_quotes_all_quote(self):
+        # The entire input is a quote, so only its contents are judged.
+        self.assertEqual(self.detector._judge_matrix_quotes(
+            "「我哋去邊度食飯？」"), "Cantonese")
+        self.assertEqual(self.detector._judge_matrix_quotes(
+            "「我們去哪裏吃飯？」"), "SWC")
+
     def test_judge(self):
         self.assertEqual(self.detector.judge("我哋去邊度？"), "Cantonese")
         self.assertEqual(self.detector.judge("我们去哪里？"), "SWC")
         self.assertEqual(self.detector.judge("Hello World!"), "Neutral")
 
+    def test_judge_cross_category_exclusions(self):
+        # 是但 and 冧把 are SWC exclusions, but they are still Cantonese
+        # features: an exclusion only hides matches of its own category.
+        self.assertEqual(self.detector.judge("是但啦"), "Cantonese")
+        self.assertEqual(self.detector.judge("是旦啦"), "Cantonese")
+        self.assertEqual(self.detector.judge("冧把幾多"), "Cantonese")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,199 @@
+"""
+Generate cantonesedetect/_matcher_gen.py from the feature patterns.
+
+The four feature/exclude patterns are fixed data known at import time, so this
+tool partially evaluates them: every pattern is expanded into its literal
+alternatives and regrouped into a first-character dispatch table, and the
+emitted module walks a segment with plain dict lookups instead of the regex
+engine. Rerun this tool whenever the patterns in Detector.py change; the
+emitted source hash lets Detector.py detect a stale module and fall back.
+
+Usage: python tools/build_matcher.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cantonesedetect.Detector import (  # noqa: E402
+    CANTO_EXCLUDE, CANTO_FEATURE, SWC_EXCLUDE, SWC_FEATURE,
+    _expand_alternatives, _pattern_source_hash,
+)
+
+OUTPUT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'cantonesedetect', '_matcher_gen.py')
+
+HEADER = '''"""
+Literal-dispatch feature matcher. Auto-generated by tools/build_matcher.py
+from the patterns in Detector.py; do not edit by hand.
+
+_DISPATCH maps a first character to its candidate literals in category order,
+each tagged with a category id (0=canto_exclude, 1=swc_exclude,
+2=canto_feature, 3=swc_feature). The Cantonese pair (0, 2) and the SWC pair
+(1, 3) are matched independently of each other; count_features walks a
+segment once with one consumption position per pair, taking the same
+leftmost first-alternative match as that pair's regex scan at every position.
+"""
+
+SOURCE_HASH = {source_hash!r}
+
+# Single-character features, per category, that occur in no multi-character
+# literal of their own category pair: their totals are independent of the
+# match walk, so str.count can tally them with C-level scans.
+_INDEPENDENT_SINGLES = (
+    {singles_0!r},
+    {singles_1!r},
+    {singles_2!r},
+    {singles_3!r},
+)
+
+_DISPATCH = {{
+'''
+
+FOOTER = '''}
+
+# The dispatch table with the independent-single candidates removed, for the
+# long-segment path where they are counted by str.count instead. A character
+# can be an independent single in one pair and start a phrase of the other,
+# so filtering happens per candidate, not per table entry.
+_PHRASE_DISPATCH = {
+    first: kept for first, kept in (
+        (first, tuple(
+            (category, literal) for category, literal in candidates
+            if len(literal) > 1 or literal not in _INDEPENDENT_SINGLES[category]
+        ))
+        for first, candidates in _DISPATCH.items())
+    if kept
+}
+
+# Above this many characters, one C-level str.count scan per independent single
+# costs less than dispatching on those characters in the Python walk (measured
+# crossover is around 160 characters on CPython 3.11).
+_SINGLE_COUNT_MIN = 200
+
+
+def count_features(s):
+    """
+    Count matches per category in one pass over the segment.
+
+    Args:
+        s (str): The segment of text to scan.
+
+    Returns:
+        tuple: (canto_exclude, swc_exclude, canto_feature, swc_feature) counts.
+    """
+    counts = [0, 0, 0, 0]
+    n = len(s)
+    if n >= _SINGLE_COUNT_MIN:
+        for category, chars in enumerate(_INDEPENDENT_SINGLES):
+            total = 0
+            for c in chars:
+                total += s.count(c)
+            counts[category] = total
+        dispatch_get = _PHRASE_DISPATCH.get
+    else:
+        dispatch_get = _DISPATCH.get
+    canto_next = swc_next = 0
+    i = 0
+    while i < n:
+        if i < canto_next and i < swc_next:
+            i = canto_next if canto_next < swc_next else swc_next
+            continue
+        candidates = dispatch_get(s[i])
+        if candidates is not None:
+            canto_done = i < canto_next
+            swc_done = i < swc_next
+            for category, literal in candidates:
+                if (swc_done if category & 1 else canto_done):
+                    continue
+                if s.startswith(literal, i):
+                    counts[category] += 1
+                    if category & 1:
+                        swc_done = True
+                        swc_next = i + len(literal)
+                    else:
+                        canto_done = True
+                        canto_next = i + len(literal)
+                    if canto_done and swc_done:
+                        break
+        i += 1
+    return counts[0], counts[1], counts[2], counts[3]
+'''
+
+
+def build_dispatch():
+    """
+    Group the expanded literals of all four patterns by first character.
+
+    Returns:
+        dict: first character -> list of (category, literal) in priority order.
+    """
+    dispatch = {}
+    seen_pairs = {}
+    sources = (CANTO_EXCLUDE, SWC_EXCLUDE, CANTO_FEATURE, SWC_FEATURE)
+    for category, source in enumerate(sources):
+        for literal in _expand_alternatives(source):
+            # Within a pair, a duplicate literal keeps its first priority: the
+            # regex engine could never reach a later identical alternative.
+            # Across pairs both copies are kept (是但 is both a Cantonese
+            # feature and an SWC exclusion), since the pairs match
+            # independently.
+            pairs = seen_pairs.setdefault(literal, set())
+            if category & 1 in pairs:
+                continue
+            pairs.add(category & 1)
+            dispatch.setdefault(literal[0], []).append((category, literal))
+    return dispatch
+
+
+def independent_singles(dispatch):
+    """
+    Find single-character literals whose counts are independent of the walk.
+
+    A single qualifies when it appears in no multi-character literal of its
+    own category pair (at any position), so within that pair's independent
+    scan every occurrence in a segment is matched exactly once regardless of
+    surrounding matches. The other pair's literals are irrelevant: the pairs
+    never consume each other's spans.
+
+    Args:
+        dispatch (dict): The table from build_dispatch.
+
+    Returns:
+        list: One string of qualifying characters per category.
+    """
+    all_candidates = [c for candidates in dispatch.values()
+                      for c in candidates]
+    pair_multi_chars = (
+        {char for category, literal in all_candidates
+         if len(literal) > 1 and not category & 1 for char in literal},
+        {char for category, literal in all_candidates
+         if len(literal) > 1 and category & 1 for char in literal},
+    )
+    singles = ['', '', '', '']
+    for first, candidates in dispatch.items():
+        for category, literal in candidates:
+            if len(literal) == 1 and first not in pair_multi_chars[category & 1]:
+                singles[category] += first
+    return singles
+
+
+def main():
+    dispatch = build_dispatch()
+    singles = independent_singles(dispatch)
+    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+        f.write(HEADER.format(source_hash=_pattern_source_hash(),
+                              singles_0=singles[0], singles_1=singles[1],
+                              singles_2=singles[2], singles_3=singles[3]))
+        for first in sorted(dispatch):
+            candidates = ', '.join(
+                f'({category}, {literal!r})'
+                for category, literal in dispatch[first])
+            f.write(f'    {first!r}: ({candidates},),\n')
+        f.write(FOOTER)
+    print(f'Wrote {OUTPUT_PATH} ({len(dispatch)} dispatch entries)')
+
+
+if __name__ == '__main__':
+    main()